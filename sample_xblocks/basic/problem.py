@@ -41,6 +41,79 @@ from xblock.run_script import run_script
 from xblock.fragment import Fragment
 
 
+# Checker argument specs are fixed strings from the scenario XML, but get
+# re-interpreted on every check. Parse each one only once.
+_ARG_SPEC_CACHE = {}
+
+# Each spec's leading character selects how the rest is interpreted.
+_ARG_PARSERS = {
+    ".": lambda arg_value: ("query", arg_value),
+    "$": lambda arg_value: ("context", arg_value[1:]),
+    "=": lambda arg_value: ("const", int(arg_value[1:])),
+}
+
+
+def _parse_checker_argument(arg_value):
+    """Parse a checker argument spec into an `(op, value)` pair.
+
+    Returns one of `("query", path)`, `("context", name)`, or
+    `("const", number)`.
+    """
+    try:
+        return _ARG_SPEC_CACHE[arg_value]
+    except KeyError:
+        parser = _ARG_PARSERS.get(arg_value[:1])
+        if parser is None:
+            raise ValueError("Couldn't interpret checker argument: %r" % arg_value)
+        spec = parser(arg_value)
+        _ARG_SPEC_CACHE[arg_value] = spec
+        return spec
+
+
+PROBLEM_BLOCK_JS = u"""
+            function ProblemBlock(runtime, element) {
+
+                function callIfExists(obj, fn) {
+                    if (typeof obj[fn] == 'function') {
+                        return obj[fn].apply(obj, Array.prototype.slice.call(arguments, 2));
+                    } else {
+                        return undefined;
+                    }
+                }
+
+                function handleCheckResults(results) {
+                    $.each(results.submitResults || {}, function(input, result) {
+                        callIfExists(runtime.childMap(element, input), 'handleSubmit', result);
+                    });
+                    $.each(results.checkResults || {}, function(checker, result) {
+                        callIfExists(runtime.childMap(element, checker), 'handleCheck', result);
+                    });
+                }
+
+                // To submit a problem, call all the named children's submit()
+                // function, collect their return values, and post that object
+                // to the check handler.
+                $(element).find('.check').bind('click', function() {
+                    var data = {};
+                    var children = runtime.children(element);
+                    for (var i = 0; i < children.length; i++) {
+                        var child = children[i];
+                        if (child.name !== undefined) {
+                            data[child.name] = callIfExists(child, 'submit');
+                        }
+                    }
+                    var handlerUrl = runtime.handlerUrl(element, 'check')
+                    $.post(handlerUrl, JSON.stringify(data)).success(handleCheckResults);
+                });
+
+                $(element).find('.rerandomize').bind('click', function() {
+                    var handlerUrl = runtime.handlerUrl(element, 'rerandomize');
+                    $.post(handlerUrl, JSON.stringify({}));
+                });
+            }
+            """
+
+
 class ProblemBlock(XBlock):
     """A generalized container of InputBlocks and Checkers.
 
@@ -106,48 +179,7 @@ class ProblemBlock(XBlock):
             "problem.html",
             named_children=named_child_frags
         ))
-        result.add_javascript("""
-            function ProblemBlock(runtime, element) {
-
-                function callIfExists(obj, fn) {
-                    if (typeof obj[fn] == 'function') {
-                        return obj[fn].apply(obj, Array.prototype.slice.call(arguments, 2));
-                    } else {
-                        return undefined;
-                    }
-                }
-
-                function handleCheckResults(results) {
-                    $.each(results.submitResults || {}, function(input, result) {
-                        callIfExists(runtime.childMap(element, input), 'handleSubmit', result);
-                    });
-                    $.each(results.checkResults || {}, function(checker, result) {
-                        callIfExists(runtime.childMap(element, checker), 'handleCheck', result);
-                    });
-                }
-
-                // To submit a problem, call all the named children's submit()
-                // function, collect their return values, and post that object
-                // to the check handler.
-                $(element).find('.check').bind('click', function() {
-                    var data = {};
-                    var children = runtime.children(element);
-                    for (var i = 0; i < children.length; i++) {
-                        var child = children[i];
-                        if (child.name !== undefined) {
-                            data[child.name] = callIfExists(child, 'submit');
-                        }
-                    }
-                    var handlerUrl = runtime.handlerUrl(element, 'check')
-                    $.post(handlerUrl, JSON.stringify(data)).success(handleCheckResults);
-                });
-
-                $(element).find('.rerandomize').bind('click', function() {
-                    var handlerUrl = runtime.handlerUrl(element, 'rerandomize');
-                    $.post(handlerUrl, JSON.stringify({}));
-                });
-            }
-            """)
+        result.add_javascript(PROBLEM_BLOCK_JS)
         result.initialize_js('ProblemBlock')
         return result
 
@@ -166,13 +198,10 @@ class ProblemBlock(XBlock):
         self.problem_attempted = True
         context = self.calc_context({})
 
-        child_map = {}
         # self.children is an attribute obtained from ChildrenModelMetaclass, so disable the
         # static pylint checking warning about this.
-        for child_id in self.children:  # pylint: disable=E1101
-            child = self.runtime.get_block(child_id)
-            if child.name:
-                child_map[child.name] = child
+        children = [self.runtime.get_block(child_id) for child_id in self.children]  # pylint: disable=E1101
+        child_map = {child.name: child for child in children if child.name}
 
         # For each InputBlock, call the submit() method with the browser-sent
         # input data.
@@ -188,20 +217,18 @@ class ProblemBlock(XBlock):
         check_results = {}
         for checker in checkers:
             arguments = checker.arguments
-            kwargs = {}
-            kwargs.update(arguments)
+            kwargs = dict(arguments)
             for arg_name, arg_value in arguments.items():
-                if arg_value.startswith("."):
-                    values = list(self.runtime.querypath(self, arg_value))
+                op, value = _parse_checker_argument(arg_value)
+                if op == "query":
+                    values = list(self.runtime.querypath(self, value))
                     # TODO: What is the specific promised semantic of the iterability
                     # of the value returned by querypath?
                     kwargs[arg_name] = values[0]
-                elif arg_value.startswith("$"):
-                    kwargs[arg_name] = context.get(arg_value[1:])
-                elif arg_value.startswith("="):
-                    kwargs[arg_name] = int(arg_value[1:])
+                elif op == "context":
+                    kwargs[arg_name] = context.get(value)
                 else:
-                    raise ValueError("Couldn't interpret checker argument: %r" % arg_value)
+                    kwargs[arg_name] = value
             result = checker.check(**kwargs)
             if checker.name:
                 check_results[checker.name] = result
@@ -326,10 +353,7 @@ class CheckerBlock(XBlock):
         """
         # Introspect the .check() method, and collect arguments it expects.
         argspec = inspect.getargspec(self.check)
-        arguments = {}
-        for arg in argspec.args[1:]:
-            arguments[arg] = node.attrib.pop(arg)
-        self.arguments = arguments
+        self.arguments = {arg: node.attrib.pop(arg) for arg in argspec.args[1:]}
 
     @classmethod
     def parse_xml(cls, node, runtime, keys, id_generator):
@@ -351,6 +375,20 @@ class CheckerBlock(XBlock):
         raise NotImplementedError()
 
 
+TEXT_INPUT_JS = u"""
+            function TextInputBlock(runtime, element) {
+                return {
+                    submit: function() {
+                        return $(element).find(':input').serializeArray();
+                    },
+                    handleSubmit: function(result) {
+                        $(element).find('.message').text((result || {}).error || '');
+                    }
+                }
+            }
+            """
+
+
 class TextInputBlock(InputBlock):
     """An XBlock that accepts text input."""
 
@@ -365,18 +403,7 @@ class TextInputBlock(InputBlock):
         """Returns a view of the problem - a javascript text input field."""
         html = u"<input type='text' name='input' value='{0}'><span class='message'></span>".format(self.student_input)
         result = Fragment(html)
-        result.add_javascript("""
-            function TextInputBlock(runtime, element) {
-                return {
-                    submit: function() {
-                        return $(element).find(':input').serializeArray();
-                    },
-                    handleSubmit: function(result) {
-                        $(element).find('.message').text((result || {}).error || '');
-                    }
-                }
-            }
-            """)
+        result.add_javascript(TEXT_INPUT_JS)
         result.initialize_js('TextInputBlock')
         return result
 
@@ -389,6 +416,38 @@ class TextInputBlock(InputBlock):
                 return {'error': '"%s" is not an integer' % self.student_input}
 
 
+EQUALITY_CHECKER_TEMPLATE = u"""
+            <script type="text/template" id="xblock-equality-template">
+                <% if (attempted !== "True") {{ %>
+                    (Not attempted)
+                <% }} else if (correct === "True") {{ %>
+                    <img src="{correct}">
+                <% }} else {{ %>
+                    <img src="{incorrect}">
+                <% }} %>
+            </script>
+            """
+
+EQUALITY_CHECKER_JS = u"""
+            function EqualityCheckerBlock(runtime, element) {
+                var template = _.template($("#xblock-equality-template").html());
+                function render() {
+                    var data = $("span.mydata", element).data();
+                    $("span.indicator", element).html(template(data));
+                }
+                render();
+                return {
+                    handleCheck: function(result) {
+                        $("span.mydata", element)
+                              .data("correct", result ? "True" : "False")
+                              .data("attempted", "True");
+                        render();
+                    }
+                }
+            }
+            """
+
+
 class EqualityCheckerBlock(CheckerBlock):
     """An XBlock that checks the equality of two student data fields."""
 
@@ -436,37 +495,11 @@ class EqualityCheckerBlock(CheckerBlock):
             'incorrect': self.runtime.local_resource_url(
                 self, 'public/images/incorrect-icon.png'),
         }
-        result.add_resource(u"""
-            <script type="text/template" id="xblock-equality-template">
-                <% if (attempted !== "True") {{ %>
-                    (Not attempted)
-                <% }} else if (correct === "True") {{ %>
-                    <img src="{correct}">
-                <% }} else {{ %>
-                    <img src="{incorrect}">
-                <% }} %>
-            </script>
-            """.format(**format_data),
+        result.add_resource(
+            EQUALITY_CHECKER_TEMPLATE.format(**format_data),
             "text/html")
 
-        result.add_javascript("""
-            function EqualityCheckerBlock(runtime, element) {
-                var template = _.template($("#xblock-equality-template").html());
-                function render() {
-                    var data = $("span.mydata", element).data();
-                    $("span.indicator", element).html(template(data));
-                }
-                render();
-                return {
-                    handleCheck: function(result) {
-                        $("span.mydata", element)
-                              .data("correct", result ? "True" : "False")
-                              .data("attempted", "True");
-                        render();
-                    }
-                }
-            }
-            """)
+        result.add_javascript(EQUALITY_CHECKER_JS)
 
         result.initialize_js('EqualityCheckerBlock')
         return result
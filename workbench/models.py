@@ -19,6 +19,78 @@ def shorten_scope_name(scope_name):
     return rest
 
 
+# The "children" and "parent" scopes carry their own names; every other scope
+# is named after its block scope. A lookup table beats re-testing membership
+# on every access.
+_SPECIAL_SCOPE_NAMES = {
+    Scope.parent: shorten_scope_name(Scope.parent.attr_name),
+    Scope.children: shorten_scope_name(Scope.children.attr_name),
+}
+
+# The short name for a given scope never changes, and we resolve it on every
+# key-value access. Prime the cache with all the named scopes up front; the
+# lazy branch in _scope_name only runs for ad-hoc Scope instances.
+_SCOPE_NAME_CACHE = dict(_SPECIAL_SCOPE_NAMES)
+_SCOPE_NAME_CACHE.update(
+    (scope, shorten_scope_name(scope.block.attr_name))
+    for scope in Scope.named_scopes()
+)
+
+
+def _scope_name(scope):
+    """Get the short scope name for `scope`, a `KeyValueStore.Key` scope."""
+    try:
+        return _SCOPE_NAME_CACHE[scope]
+    except KeyError:
+        name = _SPECIAL_SCOPE_NAMES.get(scope)
+        if name is None:
+            name = shorten_scope_name(scope.block.attr_name)
+        _SCOPE_NAME_CACHE[scope] = name
+        return name
+
+
+# Scope names whose keys don't follow the {scenario}.{tag}... id convention.
+_UNSCENARIOED_SCOPE_NAMES = frozenset(["type", "all"])
+
+# Everything `get_for_key` derives from a key except the user_id depends only
+# on (scope, scope_id), both of which are fixed for a given field of a given
+# block. Cache the derivation so repeated accesses skip the string parsing.
+_KEY_PLAN_CACHE = {}
+
+
+def _key_plan(scope, scope_id):
+    """Get the `get_or_create` kwargs, except user_id, for a key's row."""
+    try:
+        return _KEY_PLAN_CACHE[(scope, scope_id)]
+    except KeyError:
+        block_scope_name = _scope_name(scope)
+
+        # A block_scope_name of "type" is special -- this means that it's a
+        # preferences scoped var that is global to the XBlock class (and not to
+        # any particular scenario, definition, or usage). As such, it doesn't
+        # abide by the {scenario}.{tag}.{def}.{usage} convention as our other
+        # keys do, and is always simply {tag}
+        #
+        # A block_scope_name of "all" means user_info -- data that is
+        # specific to a user, but crosses all scenarios and blocks (e.g.
+        # user timezone, language). In this case, we also set our scenario to
+        # be None.
+        if block_scope_name in _UNSCENARIOED_SCOPE_NAMES:
+            scenario = None
+            tag = scope_id
+        else:
+            scenario, tag, _ = scope_id.split(".", 2)
+
+        plan = {
+            'scope': block_scope_name,
+            'scope_id': scope_id,
+            'scenario': scenario,
+            'tag': tag,
+        }
+        _KEY_PLAN_CACHE[(scope, scope_id)] = plan
+        return plan
+
+
 class XBlockState(models.Model):
     """State storage for XBlock.
 
@@ -77,40 +149,32 @@ class XBlockState(models.Model):
             "tag={self.tag}>".format(self=self)
 
     @classmethod
-    def get_for_key(cls, key):
-        """Get or create the model row for a given `KeyValueStore.Key` `key`."""
-        if key.scope in [Scope.parent, Scope.children]:
-            block_scope_full_name = key.scope.attr_name
-        else:
-            block_scope_full_name = key.scope.block.attr_name
-        block_scope_name = shorten_scope_name(block_scope_full_name)
-        scope_id = key.block_scope_id
+    def get_for_key(cls, key, create=True):
+        """Get or create the model row for a given `KeyValueStore.Key` `key`.
 
-        # A block_scope_name of "type" is special -- this means that it's a
-        # preferences scoped var that is global to the XBlock class (and not to
-        # any particular scenario, definition, or usage). As such, it doesn't
-        # abide by the {scenario}.{tag}.{def}.{usage} convention as our other
-        # keys do, and is always simply {tag}
-        #
-        # A block_scope_name of "all" means user_info -- data that is
-        # specific to a user, but crosses all scenarios and blocks (e.g.
-        # user timezone, language). In this case, we also set our scenario to
-        # be None.
-        if block_scope_name in ["type", "all"]:
-            scenario = None
-            tag = scope_id
-        else:
-            scenario, tag, _ = scope_id.split(".", 2)
-
-        record, _ = cls.objects.get_or_create(
-            scope=block_scope_name,
-            scope_id=key.block_scope_id,
-            user_id=key.user_id,
-            scenario=scenario,
-            tag=tag,
-        )
+        With `create=False`, return None for a missing row instead of
+        creating one, so read-only lookups don't write to the database.
+        """
+        plan = _key_plan(key.scope, key.block_scope_id)
+        if not create:
+            try:
+                return cls.objects.get(user_id=key.user_id, **plan)
+            except cls.DoesNotExist:
+                return None
+        record, _ = cls.objects.get_or_create(user_id=key.user_id, **plan)
         return record
 
+    @classmethod
+    def coords_for_key(cls, key):
+        """Get the coordinates of the row that stores state for `key`.
+
+        Distinct keys can share one row -- for instance, settings and
+        user_state both live in the "usage" scope row when there is no
+        user -- so bulk operations must group keys by these coordinates,
+        not by the key's scope.
+        """
+        return (_scope_name(key.scope), key.block_scope_id, key.user_id)
+
     @classmethod
     def prep_for_scenario_loading(cls):
         """This method should be executed once before loading scenarios.
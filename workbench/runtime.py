@@ -47,11 +47,29 @@ class WorkbenchDjangoKeyValueStore(KeyValueStore):
     rather than having a single row for each field name. This is why there's
     some JSON packing/unpacking code.
     """
+    def __init__(self):
+        # When not None, a dict caching values read within the current
+        # request. See `begin_request`.
+        self._request_cache = None
+
     # Workbench-special methods.
     def clear(self):
         """Clear all data from the store."""
         XBlockState.objects.all().delete()
 
+    def begin_request(self):
+        """Start caching reads until `end_request` is called.
+
+        Views wrap a rendering pass in begin/end so that a field read
+        many times during one render only hits the database once. Writes
+        made through this store keep the cache in sync.
+        """
+        self._request_cache = {}
+
+    def end_request(self):
+        """Stop request-level caching and forget anything cached."""
+        self._request_cache = None
+
     def prep_for_scenario_loading(self):
         """Reset any state that's necessary before we load scenarios."""
         XBlockState.prep_for_scenario_loading()
@@ -63,8 +81,16 @@ class WorkbenchDjangoKeyValueStore(KeyValueStore):
     # KeyValueStore methods.
     def get(self, key):
         """Get state for a given `KeyValueStore.Key`."""
-        record = XBlockState.get_for_key(key)
-        return json.loads(record.state)[key.field_name]
+        cache = self._request_cache
+        if cache is not None and key in cache:
+            return cache[key]
+        record = XBlockState.get_for_key(key, create=False)
+        if record is None:
+            raise KeyError(key.field_name)
+        value = json.loads(record.state)[key.field_name]
+        if cache is not None:
+            cache[key] = value
+        return value
 
     def set(self, key, value):
         """Set state for a given `KeyValueStore.Key` to `value`."""
@@ -74,20 +100,82 @@ class WorkbenchDjangoKeyValueStore(KeyValueStore):
 
         record.state = self._to_json_str(state_dict)
         record.save()
+        if self._request_cache is not None:
+            self._request_cache[key] = value
 
     def delete(self, key):
         """Delete state for a given `KeyValueStore.Key`."""
-        record = XBlockState.get_for_key(key)
+        record = XBlockState.get_for_key(key, create=False)
+        if record is None:
+            raise KeyError(key.field_name)
         state_dict = json.loads(record.state)
         del state_dict[key.field_name]
         record.state = self._to_json_str(state_dict)
         record.save()
+        if self._request_cache is not None:
+            self._request_cache.pop(key, None)
 
     def has(self, key):
         """Check if an entry exists for `KeyValueStore.Key`."""
-        record = XBlockState.get_for_key(key)
-        state_dict = json.loads(record.state)
-        return key.field_name in state_dict
+        record = XBlockState.get_for_key(key, create=False)
+        if record is None:
+            return False
+        return key.field_name in json.loads(record.state)
+
+    def get_many(self, keys):
+        """Get the values for all `keys`, loading each record only once.
+
+        All the fields for a given (scope, scope_id, user_id) live in one
+        JSON blob, so however many of its fields are requested, each record
+        is fetched and decoded exactly once. Raises `KeyError` if any key
+        has no stored value, just like `get`.
+        """
+        # Alias the per-iteration lookups as locals: these loops run once
+        # per field.
+        coords_for_key = XBlockState.coords_for_key
+        get_for_key = XBlockState.get_for_key
+        json_loads = json.loads
+
+        state_dicts = {}
+        results = {}
+        for key in keys:
+            record_key = coords_for_key(key)
+            state_dict = state_dicts.get(record_key)
+            if state_dict is None:
+                record = get_for_key(key, create=False)
+                if record is None:
+                    raise KeyError(key.field_name)
+                state_dict = json_loads(record.state)
+                state_dicts[record_key] = state_dict
+            results[key] = state_dict[key.field_name]
+        return results
+
+    def set_many(self, update_dict):
+        """Set all the `key: value` pairs in `update_dict`.
+
+        Values going to the same record are folded into a single load and
+        save, instead of the base class's one `set` round-trip per field.
+        """
+        coords_for_key = XBlockState.coords_for_key
+        get_for_key = XBlockState.get_for_key
+        json_loads = json.loads
+
+        records = {}
+        state_dicts = {}
+        for key, value in update_dict.items():
+            record_key = coords_for_key(key)
+            if record_key not in records:
+                record = get_for_key(key)
+                records[record_key] = record
+                state_dicts[record_key] = json_loads(record.state)
+            state_dicts[record_key][key.field_name] = value
+
+        for record_key, record in records.items():
+            record.state = self._to_json_str(state_dicts[record_key])
+            record.save()
+
+        if self._request_cache is not None:
+            self._request_cache.update(update_dict)
 
 
 class ScenarioIdManager(IdReader, IdGenerator):
@@ -198,7 +286,7 @@ class ScenarioIdManager(IdReader, IdGenerator):
         try:
             return self._aside_usages[aside_id][0]
         except KeyError:
-            raise NoSuchUsage(usage_id)
+            raise NoSuchUsage(aside_id)
 
     def get_definition_id_from_aside(self, aside_id):
         """
@@ -210,7 +298,7 @@ class ScenarioIdManager(IdReader, IdGenerator):
         try:
             return self._aside_defs[aside_id][0]
         except KeyError:
-            raise NoSuchDefinition(def_id)
+            raise NoSuchDefinition(aside_id)
 
     # Workbench specific functionality
     def set_scenario(self, scenario):
@@ -224,7 +312,48 @@ class ScenarioIdManager(IdReader, IdGenerator):
         """Sometimes you create a usage for testing and just want to grab it
         back. This gives an easy hook to do that.
         """
-        return self._usages.keys()[-1] if self._usages else None
+        return list(self._usages)[-1] if self._usages else None
+
+
+# Whether a name refers to a handler is fixed per block class, so resolve it
+# once per (class, handler name) instead of re-inspecting on every request.
+_HANDLER_NAME_CACHE = {}
+
+
+def _handler_name_error(cls, handler_name):
+    """Check `handler_name` against `cls`: an error message, or None if OK."""
+    cache_key = (cls, handler_name)
+    try:
+        return _HANDLER_NAME_CACHE[cache_key]
+    except KeyError:
+        func = getattr(cls, handler_name, None)
+        if not func:
+            error = "{!r} is not a function name".format(handler_name)
+        elif not getattr(func, "_is_xblock_handler", False):
+            error = "{!r} is not a handler name".format(handler_name)
+        else:
+            error = None
+        _HANDLER_NAME_CACHE[cache_key] = error
+        return error
+
+
+# _wrap_ele resolves the same handful of static URLs on every render, and
+# the answers are fixed for the life of the process.
+_RESOURCE_URL_CACHE = {}
+
+
+# A WorkbenchRuntime is created per request, but the filesystem service is
+# stateless, so defer building it until a runtime actually needs it and then
+# share the one instance.
+_FS_SERVICE = None
+
+
+def _get_fs_service():
+    """Get the shared FSService, or None if there's no filesystem backend."""
+    global _FS_SERVICE  # pylint: disable=W0603
+    if _FS_SERVICE is None and hasattr(xblock.reference.plugins, 'FSService'):
+        _FS_SERVICE = xblock.reference.plugins.FSService()
+    return _FS_SERVICE
 
 
 class WorkbenchRuntime(Runtime):
@@ -244,8 +373,9 @@ class WorkbenchRuntime(Runtime):
             'user': WorkBenchUserService(user_id),
         }
 
-        if hasattr(xblock.reference.plugins, 'FSService'):
-            services['fs'] = xblock.reference.plugins.FSService()
+        fs_service = _get_fs_service()
+        if fs_service is not None:
+            services['fs'] = fs_service
 
         super(WorkbenchRuntime, self).__init__(ID_MANAGER, services=services)
         self.id_generator = ID_MANAGER
@@ -280,11 +410,9 @@ class WorkbenchRuntime(Runtime):
 
     def handler_url(self, block, handler_name, suffix='', query='', thirdparty=False):
         # Be sure this really is a handler.
-        func = getattr(block, handler_name, None)
-        if not func:
-            raise ValueError("{!r} is not a function name".format(handler_name))
-        if not getattr(func, "_is_xblock_handler", False):
-            raise ValueError("{!r} is not a handler name".format(handler_name))
+        error = _handler_name_error(type(block), handler_name)
+        if error:
+            raise ValueError(error)
 
         if thirdparty:
             url_base = "unauth_handler"
@@ -307,7 +435,12 @@ class WorkbenchRuntime(Runtime):
         return url
 
     def resource_url(self, resource):
-        return static("workbench/" + resource)
+        try:
+            return _RESOURCE_URL_CACHE[resource]
+        except KeyError:
+            url = static("workbench/" + resource)
+            _RESOURCE_URL_CACHE[resource] = url
+            return url
 
     def local_resource_url(self, block, uri):
         return reverse("package_resource", args=(block.scope_ids.block_type, uri))
@@ -323,11 +456,24 @@ class WorkbenchRuntime(Runtime):
         )
         log.info(event_data)
 
+    def get_blocks(self, block_ids):
+        """Get the blocks for all of `block_ids` in one batch.
+
+        The default implementation just loops over `get_block`. A runtime
+        whose state lives in a remote store can override this to fetch all
+        of the blocks in a single round-trip instead of one per block.
+        """
+        return [self.get_block(block_id) for block_id in block_ids]
+
     def query(self, block):
         return _BlockSet(self, [block])
 
 
 class _BlockSet(object):
+    # A new set is allocated for every step of a query chain, so skip the
+    # per-instance __dict__.
+    __slots__ = ('runtime', 'blocks')
+
     def __init__(self, runtime, blocks):
         self.runtime = runtime
         self.blocks = blocks
@@ -346,18 +492,17 @@ class _BlockSet(object):
     def children(self):
         them = set()
         for block in self.blocks:
-            for child_id in getattr(block, "children", ()):
-                child = self.runtime.get_block(child_id)
-                them.add(child)
+            them.update(self.runtime.get_blocks(getattr(block, "children", ())))
         return _BlockSet(self.runtime, them)
 
     def descendants(self):
         them = set()
+        get_blocks = self.runtime.get_blocks
 
         def recur(block):
-            for child_id in getattr(block, "children", ()):
-                child = self.runtime.get_block(child_id)
-                them.add(child)
+            children = get_blocks(getattr(block, "children", ()))
+            them.update(children)
+            for child in children:
                 recur(child)
 
         for block in self.blocks:
@@ -379,9 +524,13 @@ class _BlockSet(object):
         return _BlockSet(self.runtime, them)
 
     def attr(self, attr_name):
-        for block in self.blocks:
-            if hasattr(block, attr_name):
-                yield getattr(block, attr_name)
+        # Block sets are small, so a materialized list beats generator
+        # resumption overhead, and callers can iterate it more than once.
+        return [
+            getattr(block, attr_name)
+            for block in self.blocks
+            if hasattr(block, attr_name)
+        ]
 
 # Our global state (the "database").
 WORKBENCH_KVS = WorkbenchDjangoKeyValueStore()
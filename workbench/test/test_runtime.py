@@ -83,3 +83,32 @@ class TestKVStore(TestCase):
         self.assertEqual(self.kvs.get(self.key), 7)
         self.kvs.delete(self.key)
         self.assertFalse(self.kvs.has(self.key))
+
+    def test_bulk_storage(self):
+        # Use a separate record so we don't interfere with `test_storage`.
+        age_key = self.key._replace(block_scope_id="my_scenario.my_block.d1")
+        name_key = age_key._replace(field_name="name")
+        self.kvs.set_many({age_key: 7, name_key: "rusty"})
+        self.assertEqual(self.kvs.get(age_key), 7)
+        self.assertEqual(self.kvs.get(name_key), "rusty")
+        self.assertEqual(
+            self.kvs.get_many([age_key, name_key]),
+            {age_key: 7, name_key: "rusty"}
+        )
+
+    def test_get_many_missing(self):
+        missing_key = self.key._replace(block_scope_id="my_scenario.my_block.d2")
+        with self.assertRaises(KeyError):
+            self.kvs.get_many([missing_key])
+
+    def test_request_cache(self):
+        cache_key = self.key._replace(block_scope_id="my_scenario.my_block.d3")
+        self.kvs.begin_request()
+        try:
+            self.kvs.set(cache_key, 7)
+            self.assertEqual(self.kvs.get(cache_key), 7)
+            self.kvs.delete(cache_key)
+            with self.assertRaises(KeyError):
+                self.kvs.get(cache_key)
+        finally:
+            self.kvs.end_request()
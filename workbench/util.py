@@ -1,10 +1,19 @@
 """Utilities available to workbench applications."""
 
+import re
+
+# One regex pass with a table lookup per match, instead of one full string
+# scan per replacement.
+_HTML_REPLACEMENTS = {
+    "&": "&amp;",
+    " ": "&nbsp;",
+    "<": "&lt;",
+    "\n": "<br>",
+}
+
+_HTML_ESCAPE_RE = re.compile(u"[&< \n]")
+
 
 def make_safe_for_html(html):
     """Turn the text `html` into a real HTML string."""
-    html = html.replace("&", "&amp;")
-    html = html.replace(" ", "&nbsp;")
-    html = html.replace("<", "&lt;")
-    html = html.replace("\n", "<br>")
-    return html
+    return _HTML_ESCAPE_RE.sub(lambda match: _HTML_REPLACEMENTS[match.group()], html)
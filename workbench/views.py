@@ -7,7 +7,6 @@ This code is in the Workbench layer.
 import json
 import logging
 import mimetypes
-from StringIO import StringIO
 
 from django.http import HttpResponse, Http404
 from django.shortcuts import redirect, render_to_response
@@ -18,7 +17,7 @@ from xblock.django.request import webob_to_django_response, django_to_webob_requ
 from xblock.exceptions import NoSuchUsage
 
 from .models import XBlockState
-from .runtime import WorkbenchRuntime, reset_global_state
+from .runtime import WorkbenchRuntime, WORKBENCH_KVS, reset_global_state
 from .scenarios import SCENARIOS
 from xblock.plugin import PluginMissingError
 
@@ -64,7 +63,13 @@ def show_scenario(request, scenario_id, view_name='student_view', template='work
     usage_id = scenario.usage_id
     runtime = WorkbenchRuntime(student_id)
     block = runtime.get_block(usage_id)
-    frag = block.render(view_name)
+
+    # Cache repeated field reads for the duration of the rendering pass.
+    WORKBENCH_KVS.begin_request()
+    try:
+        frag = block.render(view_name)
+    finally:
+        WORKBENCH_KVS.end_request()
     log.info("End show_scenario %s", scenario_id)
     return render_to_response(template, {
         'scenario': scenario,